@@ -1,45 +1,166 @@
 import random
+import sys
+
+# Cards are packed into 32-bit integers using the Cactus Kev layout:
+#
+#   xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+#
+#   b = one bit per rank (bit 16 is a deuce, bit 28 is an ace)
+#   cdhs = one-hot suit bit
+#   r = rank (2-14)
+#   p = prime number for the rank (deuce = 2, trey = 3, ..., ace = 41)
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {'spades': 0x1000, 'hearts': 0x2000, 'diamonds': 0x4000, 'clubs': 0x8000}
+SUIT_NAMES = {bit: suit for suit, bit in SUIT_BITS.items()}
+_SUITS = ('hearts', 'diamonds', 'clubs', 'spades')
+SUITS_BY_ID = tuple(SUIT_NAMES[0x1000 << i] for i in range(4))  # Suit order within a card id (see `card_id`)
+
+# Human-readable card names indexed by card id, e.g. CARD_NAMES[card_id(card)] == "10 of hearts". The strings
+# are built (and interned) once, so naming a card for the log or a prompt is a single lookup.
+CARD_NAMES = tuple(sys.intern("%d of %s" % (rank, suit)) for rank in range(2, 15) for suit in SUITS_BY_ID)
+
+
+def encode_card(rank, suit):
+    """
+    Packs a (rank, suit) pair into a Cactus Kev card integer.
+
+    Args:
+        rank (int): The card rank (2-14, where 11 = Jack, 12 = Queen, 13 = King, 14 = Ace).
+        suit (str): The card suit ('hearts', 'diamonds', 'clubs' or 'spades').
+
+    Returns:
+        int: The packed card.
+    """
+    return SUIT_BITS[suit] | (rank << 8) | (1 << (16 + rank - 2)) | RANK_PRIMES[rank - 2]
+
+
+def rank_of(card):
+    """
+    Returns the rank (2-14) of a packed card.
+    """
+    return (card >> 8) & 0xF
+
+
+def suit_mask(card):
+    """
+    Returns the one-hot suit bit of a packed card.
+    """
+    return card & 0xF000
+
+
+def rank_bit(card):
+    """
+    Returns the one-hot rank bit of a packed card (bit 0 is a deuce, bit 12 is an ace).
+    """
+    return card >> 16
+
+
+def card_id(card):
+    """
+    Returns the compact index (0-51) of a packed card, (rank - 2) * 4 + suit, for indexing per-card tables.
+    """
+    return (((card >> 8) & 0xF) - 2) * 4 + ((card >> 12) & 0xF).bit_length() - 1
+
+
+def to_packed(card):
+    """
+    Returns a card as a packed int, accepting either a packed card or a (rank, suit) pair such as (10, 'hearts').
+    """
+    return card if isinstance(card, int) else encode_card(*card)
+
+
+def card_to_tuple(card):
+    """
+    Unpacks a card into its (rank, suit) pair, e.g. (10, 'hearts').
+    """
+    return rank_of(card), SUIT_NAMES[suit_mask(card)]
+
+
+def card_to_str(card):
+    """
+    Returns a human-readable name for a card, e.g. "10 of hearts".
+    """
+    return CARD_NAMES[card_id(card)]
+
+
+def format_cards(cards):
+    """
+    Returns a comma-separated, human-readable list of cards, e.g. "10 of hearts, 9 of diamonds".
+    """
+    return ", ".join(map(card_to_str, cards))
+
+
+# The full 52-card deck, built once: copied into every Deck on reset, and read by equity.py for the unseen cards.
+MASTER_DECK = tuple(encode_card(rank, suit) for rank in range(2, 15) for suit in _SUITS)
+
 
 class Deck:
-    def __init__(self):
+    def __init__(self, seed=None):
         """
-        Initializes a new deck of 52 cards (no jokers). Each card is represented as a tuple (rank, suit).
+        Initializes a new deck of 52 cards (no jokers). Each card is packed into an int (see `encode_card`).
         Ranks range from 2 to 14, where 11 = Jack, 12 = Queen, 13 = King, 14 = Ace.
         Suits are 'hearts', 'diamonds', 'clubs', and 'spades'.
+
+        Args:
+            seed (int): Optional seed for the deck's own random number generator, for reproducible deals.
         """
-        self.cards = [(rank, suit) for rank in range(2, 15) for suit in ['hearts', 'diamonds', 'clubs', 'spades']]
+        self._rng = random.Random(seed)
+        self._rebuild()
+
+    def _rebuild(self):
+        """
+        Refills the deck with a fresh copy of all 52 cards and shuffles it.
+        """
+        self.cards = list(MASTER_DECK)
         self.shuffle()
 
     def shuffle(self):
         """
         Shuffles the deck of cards.
         """
-        random.shuffle(self.cards)
+        self._rng.shuffle(self.cards)
 
     def deal_hand(self, num_cards=2):
         """
         Deals a hand of 'num_cards' cards from the deck (default is 2 cards for Texas Hold'em).
         
         Returns:
-            list: A list of tuples representing the dealt cards (e.g., [(10, 'hearts'), (9, 'diamonds')]).
+            list: A list of packed cards (see `card_to_tuple` to unpack them).
+        
+        Raises:
+            IndexError: If fewer than 'num_cards' cards are left in the deck.
         """
-        return [self.cards.pop() for _ in range(num_cards)]
+        return self._deal(num_cards)
 
     def deal_flop(self):
         """
         Deals the 'flop', which consists of 3 community cards.
         
         Returns:
-            list: A list of 3 tuples representing the community cards dealt during the flop.
+            list: A list of 3 packed cards representing the community cards dealt during the flop.
+        
+        Raises:
+            IndexError: If fewer than 3 cards are left in the deck.
         """
-        return [self.cards.pop() for _ in range(3)]
+        return self._deal(3)
+
+    def _deal(self, num_cards):
+        """
+        Removes the top 'num_cards' cards from the deck in one slice and returns them.
+        """
+        start = len(self.cards) - num_cards
+        if start < 0:
+            raise IndexError(f"Cannot deal {num_cards} cards from a deck of {len(self.cards)}")
+        dealt = self.cards[start:]
+        del self.cards[start:]
+        return dealt
 
     def deal_turn(self):
         """
         Deals the 'turn', which consists of 1 additional community card.
         
         Returns:
-            tuple: A tuple representing the community card dealt during the turn.
+            int: The packed community card dealt during the turn.
         """
         return self.cards.pop()
 
@@ -48,7 +169,7 @@ class Deck:
         Deals the 'river', which consists of 1 final community card.
         
         Returns:
-            tuple: A tuple representing the community card dealt during the river.
+            int: The packed community card dealt during the river.
         """
         return self.cards.pop()
 
@@ -56,5 +177,4 @@ class Deck:
         """
         Resets the deck back to a full 52 cards and shuffles it.
         """
-        self.cards = [(rank, suit) for rank in range(2, 15) for suit in ['hearts', 'diamonds', 'clubs', 'spades']]
-        self.shuffle()
+        self._rebuild()
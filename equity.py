@@ -0,0 +1,113 @@
+"""
+equity.py
+
+This module estimates how often a hand wins at showdown using Monte-Carlo run-outs. Each sample draws the
+missing community cards and the opponents' hole cards from the remaining deck in a single `random.sample`
+call and compares the integer scores from `evaluate7`.
+
+Functions:
+    - mc_equity(hole, board, deck, n, num_opponents, rng): Estimates the equity of a hand against random opponents.
+    - cached_equity(hole, board, n, num_opponents): Memoized `mc_equity` against every card not in the hand or board.
+    - clear_equity_cache(): Discards the estimates memoized by `cached_equity`.
+"""
+
+import random
+from functools import lru_cache
+from deck import SUIT_BITS, MASTER_DECK
+from hand_evaluator import evaluate7
+
+_CANONICAL_SUITS = tuple(SUIT_BITS.values())
+
+def mc_equity(hole, board, deck, n=1000, num_opponents=1, rng=random):
+    """
+    Estimates a hand's equity by simulating 'n' random run-outs against 'num_opponents' random hands.
+
+    Args:
+        hole (list): The player's packed hole cards.
+        board (list): The packed community cards dealt so far (0 to 5 cards).
+        deck (list): The packed cards that are still unseen (i.e. not in 'hole' or 'board').
+        n (int): The number of run-outs to simulate (default is 1000).
+        num_opponents (int): The number of opponents holding random hands (default is 1).
+        rng (random.Random): The random number generator to sample run-outs with.
+
+    Returns:
+        float: The share of pots won (0-1), with split pots counted fractionally.
+    """
+    missing = 5 - len(board)
+    draw = missing + 2 * num_opponents
+    sample = rng.sample
+    won = 0.0
+
+    for _ in range(n):
+        cards = sample(deck, draw)
+        runout = board + cards[:missing]
+        hero = evaluate7(*hole, *runout)
+        ties = 0
+
+        # Compare each opponent's score with the hero's as it is computed; the first better hand
+        # decides the run-out, so the remaining opponents need not be scored
+        for i in range(missing, draw, 2):
+            score = evaluate7(cards[i], cards[i + 1], *runout)
+            if score > hero:
+                break
+            if score == hero:
+                ties += 1
+        else:
+            won += 1 / (1 + ties)
+
+    return won / n
+
+
+def cached_equity(hole, board, n=1000, num_opponents=1):
+    """
+    Estimates a hand's equity like `mc_equity`, with every card not in 'hole' or 'board' unseen, and memoizes
+    the estimate. Equity doesn't depend on which suit is which, so the cards are first relabelled to canonical
+    suits; hands that differ only by a permutation of suits (e.g. the same hole cards in spades or in hearts
+    against the same board shape) share one cache entry. A repeated situation returns the first estimate until
+    `clear_equity_cache` is called (the game clears it at the start of every hand).
+
+    Args:
+        hole (list): The player's packed hole cards.
+        board (list): The packed community cards dealt so far (0 to 5 cards).
+        n (int): The number of run-outs to simulate (default is 1000).
+        num_opponents (int): The number of opponents holding random hands (default is 1).
+
+    Returns:
+        float: The share of pots won (0-1), with split pots counted fractionally.
+    """
+    return _cached_equity(*_canonical_suits(hole, board), n, num_opponents)
+
+
+def clear_equity_cache():
+    """
+    Discards the estimates memoized by `cached_equity`, so the next request for a situation samples it afresh.
+    """
+    _cached_equity.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _cached_equity(hole, board, n, num_opponents):
+    """
+    Runs `mc_equity` for suit-canonical hole and board tuples against the rest of the deck.
+    """
+    known = set(hole) | set(board)
+    deck = [card for card in MASTER_DECK if card not in known]
+    return mc_equity(list(hole), list(board), deck, n, num_opponents)
+
+
+def _canonical_suits(hole, board):
+    """
+    Relabels the suits of the (sorted) hole cards and then the (sorted) board in order of first appearance,
+    returning both as sorted tuples.
+    """
+    relabel = {}
+    groups = []
+    for cards in (sorted(hole), sorted(board)):
+        group = []
+        for card in cards:
+            suit = card & 0xF000
+            if suit not in relabel:
+                relabel[suit] = _CANONICAL_SUITS[len(relabel)]
+            group.append((card & ~0xF000) | relabel[suit])
+        groups.append(tuple(sorted(group)))
+    return groups[0], groups[1]
@@ -1,32 +1,60 @@
-from player import AIPlayer
-from deck import Deck
-from hand_evaluator import evaluate_hand
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from player import AIPlayer, PlayerState
+from deck import Deck, format_cards
+from hand_evaluator import evaluate_holdings, decode_score
+from equity import clear_equity_cache
+
+MAX_LOG_ENTRIES = 10000  # Oldest log entries are dropped beyond this
+
+# Hand descriptions indexed by hand value - 1 (hand values run from 1 = High Card to 9 = Straight Flush)
+_HAND_NAMES = (
+    "High Card", "One Pair", "Two Pair", "Three of a Kind", "Straight",
+    "Flush", "Full House", "Four of a Kind", "Straight Flush",
+)
 
 class PokerGame:
-    def __init__(self, num_players=4, starting_chips=1000):
+    def __init__(self, num_players=4, starting_chips=1000, logging_enabled=True):
         """
         Initializes the poker game with a specified number of AI players and starting chips.
         
         Args:
             num_players (int): The number of AI players in the game.
             starting_chips (int): The starting chip count for each player.
+            logging_enabled (bool): Whether to record game events (disable for fast headless simulations).
         """
         self.num_players = num_players
-        self.players = [AIPlayer(f"AI Player {i+1}", chips=starting_chips) for i in range(num_players)]
+        self.state = PlayerState(num_players, starting_chips)  # Chips, bets and activity of every seat
+        self.players = [
+            AIPlayer(f"AI Player {i+1}", chips=starting_chips, state=self.state, seat=i) for i in range(num_players)
+        ]
         self.deck = Deck()
         self.community_cards = []
         self.pot = 0
-        self.log = []  # Initialize a log to store game events
+        self.log = deque(maxlen=MAX_LOG_ENTRIES)  # Initialize a log to store game events
+        self.log_count = 0  # Total number of events ever logged, including dropped ones
+        self.logging_enabled = logging_enabled
         self.dealer_position = 0  # Starting position for the dealer
+        self.decision_pool = ThreadPoolExecutor(max_workers=num_players)  # Fetches AI decisions concurrently
+
+    def close(self):
+        """
+        Shuts down the thread pool used to fetch AI decisions. Call this once the game is no longer played.
+        """
+        self.decision_pool.shutdown(wait=True)
 
     def play_pre_flop(self):
         """
         Pre-flop stage where players are dealt their hole cards.
         """
-        self.log.append("\n--- New Round ---")
-        self.deck.reset()
+        self.log_event("\n--- New Round ---")
+        # A full deck was shuffled and never dealt from (e.g. a fresh game), so it can be reused as-is
+        if len(self.deck.cards) < 52:
+            self.deck.reset()
         self.community_cards = []
         self.pot = 0
+        clear_equity_cache()  # Equity estimates are only reused within a hand
 
         # Rotate the dealer position
         self.dealer_position = (self.dealer_position + 1) % self.num_players
@@ -34,8 +62,7 @@ class PokerGame:
         # Deal hands to all players
         for player in self.players:
             player.deal_hand(self.deck.deal_hand())
-            hand_text = ", ".join([f"{card[0]} of {card[1]}" for card in player.hand])
-            self.log.append(f"{player.name} is dealt {hand_text}")
+            self.log_event("%s is dealt %s", player.name, tuple(player.hand))
 
         # Pre-flop betting round
         self.betting_round("Pre-Flop")
@@ -49,7 +76,7 @@ class PokerGame:
         Deals the Flop (3 community cards) and shows them to the players, followed by the Flop betting round.
         """
         self.community_cards = self.deck.deal_flop()
-        self.log.append(f"Flop: {self.community_cards}")
+        self.log_event("Flop: %s", tuple(self.community_cards))
         self.betting_round("Flop")
 
         if not self.any_active_players():
@@ -61,7 +88,7 @@ class PokerGame:
         """
         turn = self.deck.deal_turn()
         self.community_cards.append(turn)
-        self.log.append(f"Turn: {self.community_cards}")
+        self.log_event("Turn: %s", tuple(self.community_cards))
         self.betting_round("Turn")
 
         if not self.any_active_players():
@@ -73,7 +100,7 @@ class PokerGame:
         """
         river = self.deck.deal_river()
         self.community_cards.append(river)
-        self.log.append(f"River: {self.community_cards}")
+        self.log_event("River: %s", tuple(self.community_cards))
         self.betting_round("River")
 
         if not self.any_active_players():
@@ -86,15 +113,25 @@ class PokerGame:
         Args:
             round_name (str): The name of the betting round (e.g., "Pre-Flop", "Flop", "Turn", "River").
         """
-        self.log.append(f"\n--- {round_name} Betting Round ---")
+        self.log_event("\n--- %s Betting Round ---", round_name)
         current_bet = 0
+        chips_before = sum(self.state.chips)
+        self.state.clear_bets()  # Bets from earlier rounds are already in the pot
+
+        # The AI decisions only depend on the cards, so request them all at once and apply them in seat order
+        pending = {
+            player: player.request_decision(self.community_cards, self.decision_pool)
+            for player in self.players if player.is_active and player.chips > 0
+        }
         for player in self.players:
             if player.is_active:
-                decision = player.make_decision(self.community_cards, current_bet)
+                future = pending.get(player)
+                decision = player.make_decision(self.community_cards, current_bet, future.result() if future else None)
                 if player.current_bet > current_bet:
                     current_bet = player.current_bet
-                self.pot += player.current_bet  # Add to the pot
-                self.log.append(f"{player.name} {decision}s {player.current_bet} chips.")
+                self.log_event("%s %ss %d chips.", player.name, decision, player.current_bet)
+
+        self.pot += chips_before - sum(self.state.chips)  # Add the round's bets to the pot once
     
     def determine_winner(self):
         """
@@ -107,33 +144,28 @@ class PokerGame:
         active_players = [player for player in self.players if player.is_active]
 
         if len(active_players) == 0:
-            self.log.append("No active players. The round ends with no winner.")
+            self.log_event("No active players. The round ends with no winner.")
             # Increment total rounds for all players, even if no winner
             for player in self.players:
                 player.total_rounds += 1
             return None, "No winner"
 
-        best_hand_value = None
-        best_player = None
-        winning_hand = ""
+        # Score every active hand in one batch against the shared board; packed scores compare as plain ints
+        scores = evaluate_holdings([player.hand for player in active_players], self.community_cards)
+        best_score = max(scores)
+        best_player = active_players[scores.index(best_score)]  # Earliest seat wins ties
+        winning_hand = self.describe_hand_value(decode_score(best_score)[0])
 
-        for player in active_players:
-            hand_value, best_ranks = evaluate_hand(player.hand, self.community_cards)
-            hand_description = self.describe_hand_value(hand_value)
-            self.log.append(f"{player.name}'s hand value: {hand_value} with best ranks: {best_ranks} ({hand_description})")
-
-            if best_hand_value is None or hand_value > best_hand_value[0]:
-                best_hand_value = (hand_value, best_ranks)
-                best_player = player
-                winning_hand = hand_description
-            elif hand_value == best_hand_value[0] and best_ranks > best_hand_value[1]:
-                best_hand_value = (hand_value, best_ranks)
-                best_player = player
-                winning_hand = hand_description
+        # Decode the scores only for the log, once the winner is known
+        if self.logging_enabled:
+            for player, score in zip(active_players, scores):
+                hand_value, best_ranks = decode_score(score)
+                self.log_event("%s's hand value: %d with best ranks: %s", player.name, hand_value, best_ranks)
 
         if best_player:
             best_player.wins += 1  # Increment win count
-            self.log.append(f"\nWinner: {best_player.name} with hand {best_player.hand} and community cards {self.community_cards}")
+            self.log_event("\nWinner: %s with hand %s and community cards %s",
+                           best_player.name, tuple(best_player.hand), tuple(self.community_cards))
         
         # Increment total rounds for all players
         for player in self.players:
@@ -150,25 +182,13 @@ class PokerGame:
         
         Returns:
             str: A description of the hand (e.g., "Flush", "Two Pair").
+        
+        Raises:
+            ValueError: If 'hand_value' is outside 1 (High Card) to 9 (Straight Flush).
         """
-        if hand_value >= 8:
-            return "Straight Flush"
-        elif hand_value == 7:
-            return "Four of a Kind"
-        elif hand_value == 6:
-            return "Full House"
-        elif hand_value == 5:
-            return "Flush"
-        elif hand_value == 4:
-            return "Straight"
-        elif hand_value == 3:
-            return "Three of a Kind"
-        elif hand_value == 2:
-            return "Two Pair"
-        elif hand_value == 1:
-            return "One Pair"
-        else:
-            return "High Card"
+        if not 1 <= hand_value <= len(_HAND_NAMES):
+            raise ValueError(f"Invalid hand value: {hand_value}")
+        return _HAND_NAMES[hand_value - 1]
 
     def any_active_players(self):
         """
@@ -177,7 +197,23 @@ class PokerGame:
         Returns:
             bool: True if there are active players, False otherwise.
         """
-        return any(player.is_active for player in self.players)
+        return any(self.state.active)
+
+    def log_event(self, message, *args):
+        """
+        Appends an event to the game log, unless logging is disabled.
+
+        Like the standard `logging` module, the message is only formatted when the log is read: 'args' are
+        substituted into it with the % operator, and tuples of packed cards are rendered with `format_cards`.
+        Pass card lists as tuples so later changes to them don't alter the logged event.
+        
+        Args:
+            message (str): The event to log, optionally with % placeholders.
+            *args: Values for the placeholders.
+        """
+        if self.logging_enabled:
+            self.log.append((message, args))
+            self.log_count += 1
 
     def get_log(self):
         """
@@ -186,7 +222,36 @@ class PokerGame:
         Returns:
             list: The log of game events.
         """
-        return self.log
+        return [self.format_event(event) for event in self.log]
+
+    def get_log_since(self, index):
+        """
+        Returns the events logged since the log held 'index' events, so callers can fetch only new entries.
+        
+        Args:
+            index (int): A previous value of `log_count`.
+        
+        Returns:
+            list: The events logged since then (at most the last MAX_LOG_ENTRIES of them).
+        """
+        dropped = self.log_count - len(self.log)
+        return [self.format_event(event) for event in islice(self.log, max(index - dropped, 0), None)]
+
+    @staticmethod
+    def format_event(event):
+        """
+        Formats a logged (message, args) event into its text.
+        
+        Args:
+            event (tuple): An event as stored by `log_event`.
+        
+        Returns:
+            str: The formatted event.
+        """
+        message, args = event
+        if not args:
+            return message
+        return message % tuple(format_cards(arg) if isinstance(arg, tuple) else arg for arg in args)
 
     def get_player_win_percentages(self):
         """
@@ -197,3 +262,21 @@ class PokerGame:
         """
         win_percentages = {player.name: player.get_win_percentage() for player in self.players}
         return win_percentages
+
+    def get_player_equities(self, samples=500):
+        """
+        Estimates each active player's chance of winning the current hand against the other active players,
+        from the cards that player can see (their own hand and the community cards).
+
+        Args:
+            samples (int): The number of Monte-Carlo run-outs per player (default is 500).
+
+        Returns:
+            dict: A dictionary mapping the names of active players holding cards to their equity percentages.
+        """
+        contenders = [player for player in self.players if player.is_active and player.hand]
+        num_opponents = len(contenders) - 1
+        return {
+            player.name: player.get_equity(self.community_cards, num_opponents=num_opponents, samples=samples)
+            for player in contenders
+        }
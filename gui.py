@@ -3,12 +3,24 @@ import os
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QPushButton, QTextEdit
 from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtCore import Qt, QTimer
+from deck import SUITS_BY_ID, card_id
+from game import MAX_LOG_ENTRIES
+
+# Scaled card images keyed by packed card, loaded from disk on first use
+_PIXMAP_CACHE = {}
+
+# Card image filenames indexed by card id (see `deck.card_id`), e.g. "queen_of_hearts.png"
+_FACE_NAMES = {11: 'jack', 12: 'queen', 13: 'king', 14: 'ace'}
+_CARD_FILENAMES = tuple(
+    f"{_FACE_NAMES.get(rank, str(rank))}_of_{suit}.png" for rank in range(2, 15) for suit in SUITS_BY_ID
+)
 
 class PokerGUI(QMainWindow):
     def __init__(self, game):
         super().__init__()
         self.game = game
         self.card_image_path = os.path.join("images", "cards")  # Directory for card images
+        self._log_cursor = 0  # Number of game log events already shown
         self.init_ui()
         self.current_stage = 0  # Track the game stage
 
@@ -63,6 +75,7 @@ class PokerGUI(QMainWindow):
         self.players_layout = QHBoxLayout()
         self.player_labels = []
         self.player_cards_layouts = []  # Layouts for player cards
+        self.player_card_labels = []  # Reusable card image labels for each player
         self.player_action_labels = []  # New addition to show player actions (fold, call, etc.)
         for i in range(4):
             player_widget = QVBoxLayout()
@@ -76,6 +89,9 @@ class PokerGUI(QMainWindow):
             # Layout for card images
             card_layout = QHBoxLayout()
             card_layout.setAlignment(Qt.AlignCenter)
+            card_labels = [QLabel(), QLabel()]
+            for card_label in card_labels:
+                card_layout.addWidget(card_label)
             player_widget.addLayout(card_layout)
 
             player_action = QLabel(f"Action: None")
@@ -85,6 +101,7 @@ class PokerGUI(QMainWindow):
 
             self.player_labels.append(player_label)
             self.player_cards_layouts.append(card_layout)
+            self.player_card_labels.append(card_labels)
             self.player_action_labels.append(player_action)
             
             self.players_layout.addLayout(player_widget)
@@ -93,6 +110,9 @@ class PokerGUI(QMainWindow):
         
         # Community cards in the middle
         self.community_cards_layout = QHBoxLayout()  # Layout to hold community card images
+        self.community_card_labels = [QLabel() for _ in range(5)]  # Reusable card image labels
+        for card_label in self.community_card_labels:
+            self.community_cards_layout.addWidget(card_label)
         self.community_cards_label = QLabel("Community Cards: ")
         self.community_cards_label.setFont(QFont('Arial', 16))  # Slightly reduced font size for cards
         self.community_cards_label.setAlignment(Qt.AlignCenter)
@@ -107,6 +127,7 @@ class PokerGUI(QMainWindow):
         self.game_log.setFont(QFont('Arial', 12))
         self.game_log.setReadOnly(True)
         self.game_log.setFixedHeight(150)  # Smaller log at the bottom
+        self.game_log.document().setMaximumBlockCount(MAX_LOG_ENTRIES)  # Bound memory like the game log itself
         self.main_layout.addWidget(self.game_log)
         
         # Button to start the game
@@ -152,7 +173,7 @@ class PokerGUI(QMainWindow):
 
     def reset_game_for_next_round(self):
         """Resets the game for the next round and starts a new one."""
-        self.game.log.append("\n--- New Round ---")  # Add to the game log for the new round
+        self.game.log_event("\n--- New Round ---")  # Add to the game log for the new round
         self.current_stage = 0  # Reset the stage tracker
         self.game.deck.reset()  # Reset the deck
         for player in self.game.players:
@@ -167,12 +188,16 @@ class PokerGUI(QMainWindow):
         self.update_pot(self.game.pot)
         self.update_dealer(self.game.dealer_position)
 
-        # Highlight the current player and update their cards and actions
+        # Highlight the current player and update their cards, actions and chances of winning the hand
+        equities = self.game.get_player_equities()
         for i, player in enumerate(self.game.players):
             if player.is_active:
                 self.player_labels[i].setStyleSheet("background-color: yellow; color: black; border-radius: 10px;")
                 self.update_player_cards(i, player.hand)
-                self.player_action_labels[i].setText(f"Action: {player.current_bet} chips")  # Show current action
+                action_text = f"Action: {player.current_bet} chips"  # Show current action
+                if player.name in equities:
+                    action_text += f" | Equity: {equities[player.name]:.0f}%"
+                self.player_action_labels[i].setText(action_text)
             else:
                 self.player_labels[i].setStyleSheet("background-color: darkred; color: white; border-radius: 10px;")
                 self.clear_player_cards(i)
@@ -182,52 +207,36 @@ class PokerGUI(QMainWindow):
         self.update_game_log()
 
     def update_community_cards(self, community_cards):
-        # Clear previous community cards
-        for i in reversed(range(self.community_cards_layout.count())):
-            self.community_cards_layout.itemAt(i).widget().deleteLater()
-
-        # Display community card images
-        for card in community_cards:
-            card_image = self.get_card_image(card)
-            card_label = QLabel()
-            card_label.setPixmap(card_image)
-            self.community_cards_layout.addWidget(card_label)
+        # Display community card images, clearing the slots not dealt yet
+        self.show_cards(self.community_card_labels, community_cards)
 
     def update_player_cards(self, player_index, hand):
-        # Clear previous cards
-        for i in reversed(range(self.player_cards_layouts[player_index].count())):
-            self.player_cards_layouts[player_index].itemAt(i).widget().deleteLater()
-
         # Display player card images
-        for card in hand:
-            card_image = self.get_card_image(card)
-            card_label = QLabel()
-            card_label.setPixmap(card_image)
-            self.player_cards_layouts[player_index].addWidget(card_label)
+        self.show_cards(self.player_card_labels[player_index], hand)
 
     def clear_player_cards(self, player_index):
         # Clear card images for folded players
-        for i in reversed(range(self.player_cards_layouts[player_index].count())):
-            self.player_cards_layouts[player_index].itemAt(i).widget().deleteLater()
+        self.show_cards(self.player_card_labels[player_index], [])
+
+    def show_cards(self, card_labels, cards):
+        # Reuse the fixed pool of labels instead of recreating widgets on every refresh
+        for i, card_label in enumerate(card_labels):
+            if i < len(cards):
+                card_label.setPixmap(self.get_card_image(cards[i]))
+            else:
+                card_label.clear()
 
     def get_card_image(self, card):
-        rank, suit = card
-        suit = suit.lower()
-
-        # Map ranks to face cards
-        rank_map = {
-            11: 'jack',
-            12: 'queen',
-            13: 'king',
-            14: 'ace'
-        }
-        rank_str = rank_map.get(rank, str(rank))
-        card_filename = f"{rank_str}_of_{suit}.png"
-        card_path = os.path.join(self.card_image_path, card_filename)
+        scaled_pixmap = _PIXMAP_CACHE.get(card)
+        if scaled_pixmap is not None:
+            return scaled_pixmap
+
+        card_path = os.path.join(self.card_image_path, _CARD_FILENAMES[card_id(card)])
 
         # Load and scale the card image
         pixmap = QPixmap(card_path)
         scaled_pixmap = pixmap.scaled(80, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)  # 80x120 size limit
+        _PIXMAP_CACHE[card] = scaled_pixmap
 
         return scaled_pixmap
 
@@ -238,9 +247,10 @@ class PokerGUI(QMainWindow):
         self.dealer_label.setText(f"Dealer: AI Player {dealer_position + 1}")
 
     def update_game_log(self):
-        # This function updates the log with game details
-        log_text = "\n".join(self.game.get_log())  # Fetch log from game
-        self.game_log.setText(log_text)
+        # This function appends the game events logged since the last update
+        for line in self.game.get_log_since(self._log_cursor):
+            self.game_log.append(line)
+        self._log_cursor = self.game.log_count
         
         # Automatically scroll to the bottom of the log
         self.game_log.moveCursor(self.game_log.textCursor().End)
@@ -257,4 +267,6 @@ def run_gui(game):
     app = QApplication(sys.argv)
     gui = PokerGUI(game)
     gui.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    game.close()
+    sys.exit(exit_code)
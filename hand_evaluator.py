@@ -8,33 +8,58 @@ with the same rank (e.g., kickers for one-pair hands).
 
 Functions:
     - evaluate_hand(hand, community_cards): Evaluates the strength of a player's hand.
-    - is_straight_flush(all_cards): Checks if the hand is a straight flush.
-    - is_four_of_a_kind(rank_counts): Checks if the hand is four-of-a-kind.
-    - is_full_house(rank_counts): Checks if the hand is a full house.
-    - is_flush(suit_counts): Checks if the hand is a flush.
+    - evaluate_cards(cards): Scores a set of cards as a single comparable integer.
+    - evaluate7(c0, c1, c2, c3, c4, c5, c6): Scores exactly seven cards (unrolled evaluate_cards).
+    - evaluate_holdings(holdings, board): Scores several pairs of hole cards against the same board.
+    - decode_score(score): Unpacks a score from evaluate_cards into (hand_rank, best_ranks).
+    - classify(all_cards): Reads a hand's suit, rank and multiplicity bitsets in one pass.
+    - is_straight_flush(flush_ranks): Checks if the hand is a straight flush.
+    - is_four_of_a_kind(mult_counts): Checks if the hand is four-of-a-kind.
+    - is_full_house(mult_counts): Checks if the hand is a full house.
+    - is_flush(flush_ranks): Checks if the hand is a flush.
     - is_straight(ranks): Checks if the hand is a straight.
-    - is_three_of_a_kind(rank_counts): Checks if the hand is three-of-a-kind.
-    - is_two_pair(rank_counts): Checks if the hand is two pairs.
-    - is_one_pair(rank_counts): Checks if the hand is one pair.
+    - is_three_of_a_kind(mult_counts): Checks if the hand is three-of-a-kind.
+    - is_two_pair(mult_counts): Checks if the hand is two pairs.
+    - is_one_pair(mult_counts): Checks if the hand is one pair.
     - get_high_card(ranks): Returns the highest card(s) for high-card hands or kickers.
     - get_best_straight(ranks): Returns the highest straight.
-    - get_best_four_of_a_kind(rank_counts): Returns the rank of four-of-a-kind and a kicker.
-    - get_best_full_house(rank_counts): Returns the ranks for a full house.
-    - get_best_flush(all_cards): Returns the best five cards from a flush.
-    - get_best_three_of_a_kind(rank_counts, all_ranks): Returns the rank of the three-of-a-kind and kickers.
-    - get_best_two_pair(rank_counts, all_ranks): Returns the two pair and a kicker.
-    - get_best_one_pair(rank_counts, all_ranks): Returns the rank of the pair and kickers.
+    - get_best_four_of_a_kind(mult_masks, ranks): Returns the rank of four-of-a-kind and a kicker.
+    - get_best_full_house(mult_masks): Returns the ranks for a full house.
+    - get_best_flush(flush_ranks): Returns the best five cards from a flush.
+    - get_best_three_of_a_kind(mult_masks, ranks): Returns the rank of the three-of-a-kind and kickers.
+    - get_best_two_pair(mult_masks, ranks): Returns the two pair and a kicker.
+    - get_best_one_pair(mult_masks, ranks): Returns the rank of the pair and kickers.
+
+Within the rank-by-rank evaluation, ranks are held as 13-bit masks (bit 0 is a deuce, bit 12 is an ace), and
+the ranks held exactly k times as mult_masks[k] and their number as mult_counts[k] (see `classify`).
 """
 
-from collections import Counter
+from itertools import combinations_with_replacement
+from math import prod
+from deck import RANK_PRIMES
+
+# Number of tiebreaker ranks `evaluate_hand` reports for each hand rank.
+_TIEBREAK_LENGTHS = (0, 5, 4, 3, 3, 5, 5, 2, 2, 5)
+
+# Scores of non-flush paired hands keyed by the product of their rank primes. Every five-card hand is
+# scored at import (see `_build_paired_scores`); six- and seven-card hands are added on first sight. The key
+# space is bounded (about 74,000 multisets of 5 to 7 ranks), so the cache never needs evicting.
+_PAIRED_SCORES = {}
+
+# Number of set bits in every 13-bit mask (a rank mask, or a card's suit nibble). A table lookup is as fast as
+# `int.bit_count()`, which would require Python 3.10 or later.
+_POPCOUNT = bytes(bin(mask).count("1") for mask in range(1 << 13))
+
+# Hand rank of each five-card paired shape, by the counts of its ranks in descending order.
+_PAIRED_SHAPES = {(4, 1): 8, (3, 2): 7, (3, 1, 1): 4, (2, 2, 1): 3, (2, 1, 1, 1): 2}
 
 def evaluate_hand(hand, community_cards):
     """
     Evaluates a player's hand by combining their hand with the community cards and returning a score and high card(s) for tiebreaking.
     
     Args:
-        hand (list): A list of tuples representing the player's hand (e.g., [(10, 'hearts'), (9, 'diamonds')]).
-        community_cards (list): A list of tuples representing the community cards (e.g., [(2, 'clubs'), (5, 'spades'), ...]).
+        hand (list): A list of packed cards representing the player's hand (see `deck.encode_card`).
+        community_cards (list): A list of packed cards representing the community cards.
         
     Returns:
         tuple: A tuple (hand_rank, best_ranks) where:
@@ -42,262 +67,528 @@ def evaluate_hand(hand, community_cards):
                - best_ranks (list): The ranks of the cards contributing to the hand, for tiebreaking purposes.
     """
     all_cards = hand + community_cards
-    all_ranks = [card[0] for card in all_cards]
-    all_suits = [card[1] for card in all_cards]
+    if len(all_cards) < 5:
+        return _evaluate_ranks(all_cards)  # Too few cards for the lookup tables (e.g. hole cards only)
+    return decode_score(evaluate_cards(all_cards))
+
+
+def evaluate_cards(cards):
+    """
+    Scores 5 to 7 packed cards as a single integer, so hands can be compared with plain integer comparisons
+    (a higher score is a better hand). Fewer than 5 cards are scored rank by rank, without the lookup tables.
+
+    The score packs the hand rank above the first five tiebreaker ranks, one nibble each:
+    hand_rank << 20 | r1 << 16 | r2 << 12 | r3 << 8 | r4 << 4 | r5.
+
+    The cards are ORed together first. Flushes are looked up by the 13-bit rank mask of the flush suit, and
+    hands without a paired rank (straights and high cards) by the 13-bit mask of all ranks; both tables are
+    built once at import time. Paired hands are scored by the rank-by-rank evaluation below and cached by the
+    product of their rank primes, which identifies the ranks held regardless of order or suits.
+
+    Args:
+        cards (list): A list of packed cards (the player's hand and the community cards).
+
+    Returns:
+        int: The packed score of the best hand.
+    """
+    if len(cards) < 5:
+        return _pack_score(*_evaluate_ranks(cards))
+
+    or_all = 0
+    product = 1
+    for card in cards:
+        or_all |= card
+        product *= card & 0xFF
+
+    # With n cards spread over s suits the longest suit holds at most n - s + 1 cards,
+    # so only look for a flush when that can reach five
+    if len(cards) - _POPCOUNT[(or_all >> 12) & 0xF] >= 4:
+        flush_ranks = _flush_ranks(cards)
+        if flush_ranks:
+            return _FLUSH_LOOKUP[flush_ranks]
+
+    ranks = or_all >> 16
+    if _POPCOUNT[ranks] == len(cards):
+        return _UNIQUE_LOOKUP[ranks]
+
+    score = _PAIRED_SCORES.get(product)
+    if score is None:
+        score = _PAIRED_SCORES[product] = _pack_score(*_evaluate_ranks(cards))
+    return score
+
+
+def evaluate7(c0, c1, c2, c3, c4, c5, c6):
+    """
+    Scores exactly seven packed cards, the fixed Texas Hold'em shape of two hole cards plus five community cards.
+    Returns the same score as `evaluate_cards`, with the per-card loop unrolled into single expressions.
+    
+    Args:
+        c0, c1, c2, c3, c4, c5, c6 (int): The packed cards.
+    
+    Returns:
+        int: The packed score of the best hand.
+    """
+    or_all = c0 | c1 | c2 | c3 | c4 | c5 | c6
+
+    # Seven cards can only hold a five-card suit if they show three suits or fewer
+    if _POPCOUNT[(or_all >> 12) & 0xF] <= 3:
+        flush_ranks = _flush_ranks((c0, c1, c2, c3, c4, c5, c6))
+        if flush_ranks:
+            return _FLUSH_LOOKUP[flush_ranks]
+
+    ranks = or_all >> 16
+    if _POPCOUNT[ranks] == 7:
+        return _UNIQUE_LOOKUP[ranks]
+
+    product = (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF) * (c6 & 0xFF)
+    score = _PAIRED_SCORES.get(product)
+    if score is None:
+        score = _PAIRED_SCORES[product] = _pack_score(*_evaluate_ranks([c0, c1, c2, c3, c4, c5, c6]))
+    return score
+
+
+def evaluate_holdings(holdings, board):
+    """
+    Scores several two-card holdings against the same community cards (e.g. every player at a showdown).
+    The board's ORed bits and prime product are computed once and shared by every holding, so each holding
+    only adds its own two cards before the table lookups of `evaluate_cards`.
+    
+    Args:
+        holdings (list): A list of two-card lists of packed cards.
+        board (list): The packed community cards (usually 3 to 5 cards).
+    
+    Returns:
+        list: The `evaluate_cards` score of each holding combined with the board, in the same order.
+    """
+    board_or = 0
+    board_product = 1
+    for card in board:
+        board_or |= card
+        board_product *= card & 0xFF
+    num_cards = len(board) + 2
+    if num_cards < 5:
+        return [evaluate_cards([first, second, *board]) for first, second in holdings]
+
+    scores = []
+    for first, second in holdings:
+        or_all = board_or | first | second
+        if num_cards - _POPCOUNT[(or_all >> 12) & 0xF] >= 4:
+            flush_ranks = _flush_ranks((first, second, *board))
+            if flush_ranks:
+                scores.append(_FLUSH_LOOKUP[flush_ranks])
+                continue
+
+        ranks = or_all >> 16
+        if _POPCOUNT[ranks] == num_cards:
+            scores.append(_UNIQUE_LOOKUP[ranks])
+            continue
+
+        product = board_product * (first & 0xFF) * (second & 0xFF)
+        score = _PAIRED_SCORES.get(product)
+        if score is None:
+            score = _PAIRED_SCORES[product] = _pack_score(*_evaluate_ranks([first, second, *board]))
+        scores.append(score)
+    return scores
+
+
+def decode_score(score):
+    """
+    Unpacks a score from `evaluate_cards` into the (hand_rank, best_ranks) form returned by `evaluate_hand`.
+    
+    Args:
+        score (int): A packed hand score.
     
-    rank_counts = Counter(all_ranks)
-    suit_counts = Counter(all_suits)
+    Returns:
+        tuple: A tuple (hand_rank, best_ranks).
+    """
+    hand_rank = score >> 20
+    best_ranks = [(score >> 16) & 0xF, (score >> 12) & 0xF, (score >> 8) & 0xF, (score >> 4) & 0xF, score & 0xF]
+    return hand_rank, best_ranks[:_TIEBREAK_LENGTHS[hand_rank]]
+
+
+def _flush_ranks(cards):
+    """
+    Returns the 13-bit rank mask of the suit holding five or more of the cards, or 0 if there is no flush.
+    """
+    suited_ranks = {}
+    for card in cards:
+        suit = card & 0xF000
+        suited_ranks[suit] = suited_ranks.get(suit, 0) | (card >> 16)
+
+    for ranks in suited_ranks.values():
+        if _POPCOUNT[ranks] >= 5:
+            return ranks
+    return 0
+
+
+def _straight_high(ranks):
+    """
+    Returns the top rank of the highest straight in a 13-bit rank mask, or 0 if there is none.
+    """
+    # Shift the ranks up a bit and copy the ace into bit 0, so A-2-3-4-5 is a run like any other
+    bits = (ranks << 1) | (ranks >> 12)
+    runs = bits & (bits >> 1) & (bits >> 2) & (bits >> 3) & (bits >> 4)  # Bit i set: ranks i+1 to i+5 held
+    return runs.bit_length() + 4 if runs else 0
+
+
+def _pack_score(hand_rank, best_ranks):
+    """
+    Packs a hand rank and its first five tiebreaker ranks into a single integer score.
+    """
+    score = hand_rank
+    for i in range(5):
+        score = (score << 4) | (best_ranks[i] if i < len(best_ranks) else 0)
+    return score
+
+
+def _evaluate_ranks(all_cards):
+    """
+    Evaluates a hand rank by rank, checking for each hand type in descending order of strength.
+
+    The cards are read once by `classify`; every check below is then a query on its bitsets.
+    
+    Args:
+        all_cards (list): A list of packed cards representing all available cards.
+        
+    Returns:
+        tuple: A tuple (hand_rank, best_ranks) as described in `evaluate_hand`.
+    """
+    hand = classify(all_cards)
+    flush_ranks = hand['flush_ranks']
+    ranks = hand['rank_mask']
+    mult_masks = hand['mult_masks']
+    mult_counts = hand['mult_counts']
 
     # Check for different hands in descending order of strength
-    if is_straight_flush(all_cards):
-        return (9, get_best_straight(all_ranks))
-    elif is_four_of_a_kind(rank_counts):
-        return (8, get_best_four_of_a_kind(rank_counts))
-    elif is_full_house(rank_counts):
-        return (7, get_best_full_house(rank_counts))
-    elif is_flush(suit_counts):
-        return (6, get_best_flush(all_cards))
-    elif is_straight(all_ranks):
-        return (5, get_best_straight(all_ranks))
-    elif is_three_of_a_kind(rank_counts):
-        return (4, get_best_three_of_a_kind(rank_counts, all_ranks))
-    elif is_two_pair(rank_counts):
-        return (3, get_best_two_pair(rank_counts, all_ranks))
-    elif is_one_pair(rank_counts):
-        return (2, get_best_one_pair(rank_counts, all_ranks))
+    if is_straight_flush(flush_ranks):
+        return (9, get_best_straight(flush_ranks))
+    elif is_four_of_a_kind(mult_counts):
+        return (8, get_best_four_of_a_kind(mult_masks, ranks))
+    elif is_full_house(mult_counts):
+        return (7, get_best_full_house(mult_masks))
+    elif is_flush(flush_ranks):
+        return (6, get_best_flush(flush_ranks))
+    elif is_straight(ranks):
+        return (5, get_best_straight(ranks))
+    elif is_three_of_a_kind(mult_counts):
+        return (4, get_best_three_of_a_kind(mult_masks, ranks))
+    elif is_two_pair(mult_counts):
+        return (3, get_best_two_pair(mult_masks, ranks))
+    elif is_one_pair(mult_counts):
+        return (2, get_best_one_pair(mult_masks, ranks))
     else:
-        return (1, get_high_card(all_ranks))  # High card is the lowest hand
+        return (1, get_high_card(ranks))  # High card is the lowest hand
+
+
+def _top_k(ranks, k):
+    """
+    Returns the 'k' highest ranks (2-14) set in a 13-bit rank mask, highest first (fewer if fewer are set).
+    """
+    top = []
+    while ranks and len(top) < k:
+        high = ranks.bit_length()  # The highest set bit, 1-based, so rank = high + 1
+        top.append(high + 1)
+        ranks ^= 1 << (high - 1)
+    return top
+
+
+def classify(all_cards):
+    """
+    Reads a hand into the bitsets the hand checks query, in a single pass over the cards.
+    
+    Args:
+        all_cards (list): A list of packed cards representing all available cards.
+    
+    Returns:
+        dict: The hand's bitsets, each a 13-bit rank mask (bit 0 is a deuce, bit 12 is an ace) or a list of them:
+              - suit_masks (list): The ranks held in each suit.
+              - flush_ranks (int): The ranks held in the suit with five or more cards, or 0 if there is no flush.
+              - rank_mask (int): The ranks held in any suit.
+              - mult_masks (list): Indexed by k (0-4), the ranks held exactly k times (index 0 is unused).
+              - mult_counts (list): Indexed by k (0-4), the number of ranks held exactly k times.
+    """
+    a = b = c = d = 0
+    for card in all_cards:
+        suit = card & 0xF000
+        if suit == 0x1000:
+            a |= card >> 16
+        elif suit == 0x2000:
+            b |= card >> 16
+        elif suit == 0x4000:
+            c |= card >> 16
+        else:
+            d |= card >> 16
+
+    # A rank's count is the number of suit masks it is set in: an odd count shows up in the XOR of the
+    # four masks, a count of two or more in the OR of their pairwise ANDs
+    odd = a ^ b ^ c ^ d
+    two_or_more = (a & b) | (a & c) | (a & d) | (b & c) | (b & d) | (c & d)
+    fours = a & b & c & d
+
+    flush_ranks = 0
+    for mask in (a, b, c, d):
+        if _POPCOUNT[mask] >= 5:
+            flush_ranks = mask
 
+    mult_masks = [0, odd & ~two_or_more, two_or_more & ~odd & ~fours, odd & two_or_more, fours]
+    return {
+        'suit_masks': [a, b, c, d],
+        'flush_ranks': flush_ranks,
+        'rank_mask': a | b | c | d,
+        'mult_masks': mult_masks,
+        'mult_counts': [_POPCOUNT[mask] for mask in mult_masks],
+    }
 
-def is_straight_flush(all_cards):
+def is_straight_flush(flush_ranks):
     """
     Check if the hand is a straight flush, which is five consecutive cards of the same suit.
     
     Args:
-        all_cards (list): A list of tuples representing all available cards (player's hand and community cards).
+        flush_ranks (int): The rank mask of the flush suit, or 0 if there is no flush.
     
     Returns:
         bool: True if the hand is a straight flush, False otherwise.
     """
-    suits = [card[1] for card in all_cards]
-    suit_counts = Counter(suits)
-    
-    # Find if there's a flush (5 cards of the same suit)
-    for suit, count in suit_counts.items():
-        if count >= 5:
-            suited_cards = [card[0] for card in all_cards if card[1] == suit]
-            if is_straight(suited_cards):
-                return True
-    return False
+    return bool(flush_ranks) and is_straight(flush_ranks)
 
-def is_four_of_a_kind(rank_counts):
+def is_four_of_a_kind(mult_counts):
     """
     Check if the hand contains four cards of the same rank.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_counts (list): The number of ranks held exactly k times, indexed by k.
     
     Returns:
         bool: True if the hand is four of a kind, False otherwise.
     """
-    return 4 in rank_counts.values()
+    return mult_counts[4] >= 1
 
-def is_full_house(rank_counts):
+def is_full_house(mult_counts):
     """
     Check if the hand is a full house, which is a combination of three of a kind and a pair.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_counts (list): The number of ranks held exactly k times, indexed by k.
     
     Returns:
         bool: True if the hand is a full house, False otherwise.
     """
-    return 3 in rank_counts.values() and 2 in rank_counts.values()
+    # Two sets of trips also make a full house (the lower set plays as the pair)
+    return mult_counts[3] >= 2 or (mult_counts[3] >= 1 and mult_counts[2] >= 1)
 
-def is_flush(suit_counts):
+def is_flush(flush_ranks):
     """
     Check if the hand is a flush, which is five cards of the same suit.
     
     Args:
-        suit_counts (Counter): A Counter object representing the frequency of each card suit.
+        flush_ranks (int): The rank mask of the flush suit, or 0 if there is no flush.
     
     Returns:
         bool: True if the hand is a flush, False otherwise.
     """
-    return any(count >= 5 for count in suit_counts.values())
+    return flush_ranks != 0
 
 def is_straight(ranks):
     """
     Check if the hand is a straight, which is five consecutive ranks.
     
     Args:
-        ranks (list): A list of card ranks.
+        ranks (int): A 13-bit rank mask.
     
     Returns:
         bool: True if the hand is a straight, False otherwise.
     """
-    unique_ranks = sorted(set(ranks))
-    if len(unique_ranks) < 5:
-        return False
-    for i in range(len(unique_ranks) - 4):
-        if unique_ranks[i:i+5] == list(range(unique_ranks[i], unique_ranks[i]+5)):
-            return True
-    # Check for A-2-3-4-5 straight (Ace can be low)
-    if set([14, 2, 3, 4, 5]).issubset(unique_ranks):
-        return True
-    return False
+    return _straight_high(ranks) != 0
 
-def is_three_of_a_kind(rank_counts):
+def is_three_of_a_kind(mult_counts):
     """
     Check if the hand is three of a kind, which is three cards of the same rank.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_counts (list): The number of ranks held exactly k times, indexed by k.
     
     Returns:
         bool: True if the hand is three of a kind, False otherwise.
     """
-    return 3 in rank_counts.values()
+    return mult_counts[3] >= 1
 
-def is_two_pair(rank_counts):
+def is_two_pair(mult_counts):
     """
     Check if the hand contains two pairs.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_counts (list): The number of ranks held exactly k times, indexed by k.
     
     Returns:
         bool: True if the hand contains two pairs, False otherwise.
     """
-    return list(rank_counts.values()).count(2) >= 2
+    return mult_counts[2] >= 2
 
-def is_one_pair(rank_counts):
+def is_one_pair(mult_counts):
     """
     Check if the hand contains one pair.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_counts (list): The number of ranks held exactly k times, indexed by k.
     
     Returns:
         bool: True if the hand contains one pair, False otherwise.
     """
-    return 2 in rank_counts.values()
+    return mult_counts[2] >= 1
 
 def get_high_card(ranks):
     """
     Get the highest card(s) for a high card hand or as kickers for tiebreaking.
     
     Args:
-        ranks (list): A list of card ranks.
+        ranks (int): A 13-bit rank mask.
     
     Returns:
-        list: The highest card(s) in descending order.
+        list: The five highest ranks in descending order.
     """
-    return sorted(ranks, reverse=True)
+    return _top_k(ranks, 5)
 
 def get_best_straight(ranks):
     """
     Get the highest rank in a straight.
     
     Args:
-        ranks (list): A list of card ranks.
+        ranks (int): A 13-bit rank mask.
     
     Returns:
-        list: The highest ranks that form a straight.
+        list: The highest ranks that form a straight, or an empty list if there is none.
     """
-    unique_ranks = sorted(set(ranks))
-    for i in range(len(unique_ranks) - 4):
-        if unique_ranks[i:i+5] == list(range(unique_ranks[i], unique_ranks[i]+5)):
-            return unique_ranks[i+4:i-1:-1]
-    if set([14, 2, 3, 4, 5]).issubset(unique_ranks):
-        return [5, 4, 3, 2, 14]
-    return []
+    high = _straight_high(ranks)
+    if high == 5:
+        return [5, 4, 3, 2, 14]  # A-2-3-4-5 (Ace plays low)
+    return list(range(high, high - 5, -1)) if high else []
 
-def get_best_four_of_a_kind(rank_counts):
+def get_best_four_of_a_kind(mult_masks, ranks):
     """
     Get the rank of the four of a kind and the kicker.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_masks (list): The rank masks of the ranks held exactly k times, indexed by k.
+        ranks (int): The 13-bit mask of all available ranks.
     
     Returns:
-        list: A list with the rank of the four of a kind and the kicker.
+        list: A list with the rank of the four of a kind and the kicker (if any).
     """
-    four_rank = [rank for rank, count in rank_counts.items() if count == 4][0]
-    kicker = max([rank for rank in rank_counts if rank != four_rank])
-    return [four_rank, kicker]
+    four_rank = mult_masks[4].bit_length() + 1
+    return [four_rank] + _top_k(ranks & ~mult_masks[4], 1)  # No kicker with only four cards
 
-def get_best_full_house(rank_counts):
+def get_best_full_house(mult_masks):
     """
     Get the rank of the full house (three of a kind and a pair).
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
+        mult_masks (list): The rank masks of the ranks held exactly k times, indexed by k.
     
     Returns:
         list: A list with the rank of the three of a kind and the pair.
     """
-    three_rank = [rank for rank, count in rank_counts.items() if count == 3][0]
-    pair_rank = [rank for rank, count in rank_counts.items() if count == 2][0]
+    three_rank = mult_masks[3].bit_length() + 1
+    # The pair is the highest other rank held two or more times, which may be a lower set of trips
+    pair_rank = ((mult_masks[3] & ~(1 << (three_rank - 2))) | mult_masks[2]).bit_length() + 1
     return [three_rank, pair_rank]
 
-def get_best_flush(all_cards):
+def get_best_flush(flush_ranks):
     """
     Get the best five cards from a flush.
     
     Args:
-        all_cards (list): A list of tuples representing all available cards.
+        flush_ranks (int): The rank mask of the flush suit.
     
     Returns:
-        list: The five highest cards of the same suit.
+        list: The five highest ranks of the flush suit.
     """
-    suits = [card[1] for card in all_cards]
-    suit_counts = Counter(suits)
-    flush_suit = [suit for suit, count in suit_counts.items() if count >= 5][0]
-    flush_cards = [card[0] for card in all_cards if card[1] == flush_suit]
-    return sorted(flush_cards, reverse=True)[:5]
+    return _top_k(flush_ranks, 5)
 
-def get_best_three_of_a_kind(rank_counts, all_ranks):
+def get_best_three_of_a_kind(mult_masks, ranks):
     """
     Get the rank of the three of a kind and the two kickers.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
-        all_ranks (list): A list of all available card ranks.
+        mult_masks (list): The rank masks of the ranks held exactly k times, indexed by k.
+        ranks (int): The 13-bit mask of all available ranks.
     
     Returns:
         list: A list containing the rank of the three of a kind and two kicker cards.
     """
-    three_rank = [rank for rank, count in rank_counts.items() if count == 3][0]
-    kickers = sorted([rank for rank in all_ranks if rank != three_rank], reverse=True)[:2]
+    three_rank = mult_masks[3].bit_length() + 1
+    kickers = _top_k(ranks & ~mult_masks[3], 2)
     return [three_rank] + kickers
 
-def get_best_two_pair(rank_counts, all_ranks):
+def get_best_two_pair(mult_masks, ranks):
     """
     Get the ranks of the two pairs and the kicker.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
-        all_ranks (list): A list of all available card ranks.
+        mult_masks (list): The rank masks of the ranks held exactly k times, indexed by k.
+        ranks (int): The 13-bit mask of all available ranks.
     
     Returns:
-        list: A list containing the two pair ranks and a kicker card.
+        list: A list containing the two pair ranks and a kicker card (if any).
     """
-    pairs = sorted([rank for rank, count in rank_counts.items() if count == 2], reverse=True)[:2]
-    kicker = max([rank for rank in all_ranks if rank not in pairs])
-    return pairs + [kicker]
+    pairs = _top_k(mult_masks[2], 2)
+    return pairs + _top_k(ranks & ~(1 << (pairs[0] - 2)) & ~(1 << (pairs[1] - 2)), 1)
 
-def get_best_one_pair(rank_counts, all_ranks):
+def get_best_one_pair(mult_masks, ranks):
     """
     Get the rank of the pair and the three kickers.
     
     Args:
-        rank_counts (Counter): A Counter object representing the frequency of each card rank.
-        all_ranks (list): A list of all available card ranks.
+        mult_masks (list): The rank masks of the ranks held exactly k times, indexed by k.
+        ranks (int): The 13-bit mask of all available ranks.
     
     Returns:
         list: A list containing the rank of the pair and three kicker cards.
     """
-    pair = [rank for rank, count in rank_counts.items() if count == 2][0]
-    kickers = sorted([rank for rank in all_ranks if rank != pair], reverse=True)[:3]
+    pair = mult_masks[2].bit_length() + 1
+    kickers = _top_k(ranks & ~mult_masks[2], 3)
     return [pair] + kickers
+
+
+def _build_rank_lookups():
+    """
+    Builds the two tables indexed by a 13-bit rank mask with at least five ranks set:
+    the score of the best straight flush or flush a single suit holding those ranks makes, and the score of the
+    best straight or high card the same ranks make when they are not suited.
+
+    The second table mirrors the first: a straight flush becomes a straight and a flush becomes a high card
+    hand with the same tiebreaker ranks.
+    """
+    flushes = [0] * (1 << 13)
+    for mask in range(len(flushes)):
+        if _POPCOUNT[mask] >= 5:
+            straight = get_best_straight(mask)
+            if straight:
+                flushes[mask] = _pack_score(9, straight)
+            else:
+                flushes[mask] = _pack_score(6, _top_k(mask, 5))
+
+    straight_flush_to_straight = (9 - 5) << 20
+    flush_to_high_card = (6 - 1) << 20
+    unique = [
+        score - (straight_flush_to_straight if score >> 20 == 9 else flush_to_high_card) if score else 0
+        for score in flushes
+    ]
+    return flushes, unique
+
+def _build_paired_scores():
+    """
+    Scores every five-card hand with a paired rank, keyed by the product of its rank primes (the "products"
+    table of the Cactus Kev evaluator). Five cards with a paired rank can't make a straight or a flush, so the
+    score follows from the rank counts alone: the shape of the counts gives the hand rank, and the ranks
+    ordered by count and then by rank are the tiebreakers.
+    """
+    scores = {}
+    for ranks in combinations_with_replacement(range(2, 15), 5):
+        groups = sorted(((ranks.count(rank), rank) for rank in set(ranks)), reverse=True)
+        hand_rank = _PAIRED_SHAPES.get(tuple(count for count, _ in groups))
+        if hand_rank:
+            scores[prod(RANK_PRIMES[rank - 2] for rank in ranks)] = _pack_score(hand_rank, [rank for _, rank in groups])
+    return scores
+
+_FLUSH_LOOKUP, _UNIQUE_LOOKUP = _build_rank_lookups()
+_PAIRED_SCORES.update(_build_paired_scores())
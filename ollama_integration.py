@@ -1,9 +1,42 @@
 import requests
-import json
 import re
+import threading
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from deck import format_cards
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads  # Optional; faster when installed
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
 
 OLLAMA_API_URL = "http://localhost:11434/api/chat"
 OLLAMA_LIST_URL = "http://localhost:11434/api/tags"
+REQUEST_TIMEOUT = (2, 30)  # (connect, read) timeouts in seconds
+
+_PROMPT_TEMPLATE = (
+    "Player's hand: {hand}. "
+    "Community cards: {community}. "
+    "Respond with only one action: fold, check, bet, or raise. No explanation."
+)
+
+VALID_ACTIONS = frozenset({"fold", "check", "bet", "raise"})
+_ACTION_RE = re.compile(r'\b(fold|check|bet|raise)\b', re.IGNORECASE)
+
+# One keep-alive session per thread, so requests reuse pooled connections to the Ollama server. Decisions are
+# fetched from several worker threads at once, and requests does not guarantee a Session is thread-safe.
+_thread_local = threading.local()
+
+def _get_session():
+    """
+    Returns the calling thread's session, creating it on the thread's first request.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        session.headers.update({"Connection": "keep-alive", "Content-Type": "application/json"})
+    return session
 
 def get_available_models():
     """
@@ -13,25 +46,38 @@ def get_available_models():
         list: A list of model names.
     """
     try:
-        response = requests.get(OLLAMA_LIST_URL)
+        response = _get_session().get(OLLAMA_LIST_URL, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
-            models = response.json().get("models", [])
+            models = json_loads(response.content).get("models", [])
             model_names = [model['name'] for model in models]
             return model_names
         else:
             print(f"Error: Unable to retrieve model list. Status code: {response.status_code}")
             return []
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: the body isn't JSON
         print(f"Error contacting Ollama API: {e}")
         return []
 
+# Serializes the first model selection, so concurrent decisions wait for one lookup instead of each making their own
+_model_lock = threading.Lock()
+
 def get_poker_compatible_model():
     """
     Selects a model that is most suitable for playing poker, based on the available models.
+    The choice is cached after the first call; use `invalidate_model_cache` to pick again (e.g. after pulling a model).
+    Safe to call from several threads at once: only one of them queries the available models.
     
     Returns:
         str: The model name that is compatible with poker decisions.
     """
+    with _model_lock:
+        return _select_model()
+
+@lru_cache(maxsize=1)
+def _select_model():
+    """
+    Picks the poker model from the available models (cached; see `get_poker_compatible_model`).
+    """
     available_models = get_available_models()
     for model in available_models:
         if "llama3" in model or "command-r" in model or "qwen" in model:
@@ -41,6 +87,13 @@ def get_poker_compatible_model():
     print("No specific poker model found. Using default model: llama3:latest")
     return "llama3:latest"
 
+def invalidate_model_cache():
+    """
+    Clears the cached model choice, so the next decision queries the available models again.
+    """
+    with _model_lock:
+        _select_model.cache_clear()
+
 def sanitize_decision(decision):
     """
     Filters the AI decision to extract only valid poker actions using regex.
@@ -51,36 +104,56 @@ def sanitize_decision(decision):
     Returns:
         str: A valid poker action (fold, check, bet, raise) or 'check' as a default.
     """
-    valid_actions = ["fold", "check", "bet", "raise"]
-    action_match = re.search(r'\b(fold|check|bet|raise)\b', decision.lower())
+    action_match = _ACTION_RE.search(decision)
     
     if action_match:
-        action = action_match.group(0)
+        action = action_match.group(0).lower()
         print(f"AI chose action: {action}")
         return action
     else:
         print(f"Invalid decision received from model: {decision}. Defaulting to 'check'.")
         return "check"  # Default to 'check' if no valid action is found
 
+def stream_decision(data):
+    """
+    Streams a chat response from the Ollama API and stops reading as soon as it contains a complete poker action.
+    Closing the response early ends the generation instead of waiting for the whole message.
+    
+    Args:
+        data (dict): The chat request body (with "stream" enabled).
+    
+    Returns:
+        str: The response text received up to the first complete action (or the whole response).
+    """
+    decision = ""
+    with _get_session().post(OLLAMA_API_URL, data=json_dumps(data), timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json_loads(line)
+            decision += chunk.get("message", {}).get("content", "")
+            if chunk.get("done"):
+                break
+
+            # An action at the very end of the text may still grow into a longer word (e.g. "bet" -> "better")
+            action_match = _ACTION_RE.search(decision)
+            if action_match and action_match.end() < len(decision):
+                break
+    return decision.strip()
+
 def get_ai_decision(player_hand, community_cards, max_retries=2):
     """
     Interacts with the Ollama API to get the AI's decision based on the player's hand and community cards.
     
     Args:
-        player_hand (list): A list of tuples representing the player's hand (e.g., [(10, 'hearts'), (9, 'diamonds')]).
-        community_cards (list): A list of tuples representing the community cards (e.g., [(2, 'clubs'), (5, 'spades')]).
+        player_hand (list): A list of packed cards representing the player's hand (see `deck.encode_card`).
+        community_cards (list): A list of packed cards representing the community cards.
 
     Returns:
         str: The AI's decision (e.g., "fold", "check", "bet", "raise").
     """
-    hand_str = ', '.join([f"{card[0]} of {card[1]}" for card in player_hand])
-    community_str = ', '.join([f"{card[0]} of {card[1]}" for card in community_cards])
-
-    prompt = (
-        f"Player's hand: {hand_str}. "
-        f"Community cards: {community_str}. "
-        "Respond with only one action: fold, check, bet, or raise. No explanation."
-    )
+    prompt = _PROMPT_TEMPLATE.format(hand=format_cards(player_hand), community=format_cards(community_cards))
 
     model_name = get_poker_compatible_model()
     data = {
@@ -88,24 +161,21 @@ def get_ai_decision(player_hand, community_cards, max_retries=2):
         "messages": [
             {"role": "user", "content": prompt}
         ],
-        "stream": False
+        "stream": True,
+        "options": {"num_predict": 4}  # The answer is a single word, so cap the generation
     }
 
     # Retry logic in case of invalid responses
     for attempt in range(max_retries):
         try:
-            response = requests.post(OLLAMA_API_URL, data=json.dumps(data))
-            response.raise_for_status()
-
-            response_json = response.json()
-            decision = response_json.get("message", {}).get("content", "").strip().lower()
+            decision = stream_decision(data)
 
             # Sanitize the AI's decision to ensure it's a valid poker action
             valid_action = sanitize_decision(decision)
-            if valid_action in ["fold", "check", "bet", "raise"]:
+            if valid_action in VALID_ACTIONS:
                 return valid_action
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: a malformed response line
             print(f"Error contacting Ollama API: {e}")
             return "fold"  # Default to folding if there's an error
 
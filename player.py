@@ -1,16 +1,46 @@
 import random
+from array import array
+from deck import to_packed
 from hand_evaluator import evaluate_hand
+from equity import mc_equity, cached_equity
 from ollama_integration import get_ai_decision
 
+class PlayerState:
+    def __init__(self, num_players, chips=1000):
+        """
+        Holds the numeric state of a table of players column by column: one compact array per field, indexed by seat.
+        The game can then total or scan a field across all players without visiting each AIPlayer object.
+        
+        Args:
+            num_players (int): The number of seats.
+            chips (int): The starting amount of chips for every seat (default is 1000).
+        """
+        self.chips = array('q', [chips]) * num_players
+        self.current_bets = array('q', [0]) * num_players
+        self.active = array('b', [1]) * num_players  # 1 while the seat is still in the round
+
+    def clear_bets(self):
+        """
+        Resets every seat's current bet to 0, at the start of a betting round.
+        """
+        self.current_bets[:] = array('q', [0]) * len(self.current_bets)
+
+
 class AIPlayer:
-    def __init__(self, name, chips=1000):
+    def __init__(self, name, chips=1000, seed=None, state=None, seat=0):
         """
         Initializes an AI player with a given name and a starting number of chips.
         
         Args:
             name (str): The name of the AI player.
             chips (int): The starting amount of chips for the player (default is 1000).
+            seed (int): Optional seed for the player's own random number generator, used for bet sizing.
+            state (PlayerState): The table state holding this player's chips, bet and activity (a private
+                                 single-seat state is created if omitted).
+            seat (int): The player's index in 'state'.
         """
+        self._state = state if state is not None else PlayerState(1)
+        self.seat = seat
         self.name = name
         self.chips = chips
         self.hand = []
@@ -18,23 +48,73 @@ class AIPlayer:
         self.is_active = True  # Whether the player is still in the round
         self.wins = 0  # Track the number of rounds won
         self.total_rounds = 0  # Track the total number of rounds played
+        self._rng = random.Random(seed)
+
+    @property
+    def chips(self):
+        """
+        int: The player's chip count, stored in the table state.
+        """
+        return self._state.chips[self.seat]
+
+    @chips.setter
+    def chips(self, value):
+        self._state.chips[self.seat] = value
+
+    @property
+    def current_bet(self):
+        """
+        int: The player's bet in the current betting round, stored in the table state.
+        """
+        return self._state.current_bets[self.seat]
+
+    @current_bet.setter
+    def current_bet(self, value):
+        self._state.current_bets[self.seat] = value
+
+    @property
+    def is_active(self):
+        """
+        bool: Whether the player is still in the round, stored in the table state.
+        """
+        return bool(self._state.active[self.seat])
+
+    @is_active.setter
+    def is_active(self, value):
+        self._state.active[self.seat] = bool(value)
 
     def deal_hand(self, hand):
         """
-        Assigns a hand of cards to the AI player.
+        Assigns a hand of cards to the AI player, stored as packed cards.
         
         Args:
-            hand (list): A list of tuples representing the player's hand (e.g., [(10, 'hearts'), (9, 'diamonds')]).
+            hand (list): The player's cards, either packed (see `deck.encode_card`) or as (rank, suit) pairs.
         """
-        self.hand = hand
+        self.hand = [to_packed(card) for card in hand]
 
-    def make_decision(self, community_cards, current_bet):
+    def request_decision(self, community_cards, executor):
+        """
+        Starts asking the AI model for a decision on 'executor', without changing the player's state.
+        The request only depends on the cards, so several players' requests can be in flight at once;
+        pass the result to `make_decision` to act on it.
+        
+        Args:
+            community_cards (list): A list of packed cards representing the community cards on the table.
+            executor (concurrent.futures.Executor): The executor to run the request on.
+        
+        Returns:
+            concurrent.futures.Future: A future resolving to the AI model's decision.
+        """
+        return executor.submit(get_ai_decision, self.hand, list(community_cards))
+
+    def make_decision(self, community_cards, current_bet, decision=None):
         """
         Makes a decision based on the player's hand, community cards, and the current bet on the table.
         
         Args:
-            community_cards (list): A list of tuples representing the community cards on the table.
+            community_cards (list): A list of packed cards representing the community cards on the table.
             current_bet (int): The current bet that the player needs to match.
+            decision (str): The AI model's decision, if already fetched with `request_decision` (otherwise it is requested now).
 
         Returns:
             str: The AI's decision (fold, check, bet, raise).
@@ -43,7 +123,8 @@ class AIPlayer:
             return "fold"  # Inactive or bankrupt players can't make decisions
 
         # Get decision from the AI model via the Ollama API
-        decision = get_ai_decision(self.hand, community_cards)
+        if decision is None:
+            decision = get_ai_decision(self.hand, community_cards)
 
         # Handle decisions and update the player's state accordingly
         if decision == "fold":
@@ -84,7 +165,7 @@ class AIPlayer:
         if bet_max < bet_min:
             return self.chips  # All-in if chips are too low
 
-        return random.randint(bet_min, bet_max)
+        return self._rng.randrange(bet_min, bet_max + 1)
 
     def calculate_raise_amount(self, current_bet):
         """
@@ -104,7 +185,7 @@ class AIPlayer:
         if raise_max < raise_min:
             return self.chips  # All-in
 
-        return random.randint(raise_min, raise_max)
+        return self._rng.randrange(raise_min, raise_max + 1)
 
     def reset_for_next_round(self):
         """
@@ -126,6 +207,25 @@ class AIPlayer:
             return 0.0
         return (self.wins / self.total_rounds) * 100
 
+    def get_equity(self, community_cards, unseen_cards=None, num_opponents=1, samples=1000):
+        """
+        Estimates the player's chance of winning the current hand with Monte-Carlo run-outs.
+
+        Args:
+            community_cards (list): A list of packed cards representing the community cards on the table.
+            unseen_cards (list): The packed cards the player cannot see (e.g. the cards left in the deck). If
+                                 omitted, every card outside the player's hand and the board is unseen, and the
+                                 estimate is memoized (see `equity.cached_equity`).
+            num_opponents (int): The number of opponents still in the hand.
+            samples (int): The number of run-outs to simulate.
+
+        Returns:
+            float: The player's equity as a percentage (0-100).
+        """
+        if unseen_cards is None:
+            return cached_equity(self.hand, community_cards, samples, num_opponents) * 100
+        return mc_equity(self.hand, list(community_cards), unseen_cards, samples, num_opponents) * 100
+
     def is_bankrupt(self):
         """
         Check if the player is out of chips.
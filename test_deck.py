@@ -0,0 +1,38 @@
+"""
+test_deck.py
+
+Regression tests for deck.py: dealing takes cards from the top of the deck, and dealing more cards than are left
+raises instead of returning a short hand.
+
+Run with: python -m unittest
+"""
+
+import unittest
+
+from deck import Deck
+
+
+class DealTest(unittest.TestCase):
+    def test_deal_hand_takes_cards_from_the_top(self):
+        deck = Deck(seed=1)
+        top = deck.cards[-2:]
+        self.assertEqual(deck.deal_hand(), top)
+        self.assertEqual(len(deck.cards), 50)
+
+    def test_deal_no_cards(self):
+        deck = Deck(seed=1)
+        self.assertEqual(deck.deal_hand(0), [])
+        self.assertEqual(len(deck.cards), 52)
+
+    def test_dealing_past_the_end_raises(self):
+        deck = Deck(seed=1)
+        deck.deal_hand(50)
+        with self.assertRaises(IndexError):
+            deck.deal_flop()
+        with self.assertRaises(IndexError):
+            deck.deal_hand(3)
+        self.assertEqual(len(deck.cards), 2)  # A failed deal leaves the deck untouched
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+test_game.py
+
+Regression tests for the betting in game.py. The AI decisions are scripted by street, so the chips moved into
+the pot can be checked against the chips taken from the players' stacks.
+
+Run with: python -m unittest
+"""
+
+import importlib.util
+import random
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+from deck import Deck
+
+# Scripted decision for each street, keyed by the number of community cards: a bet followed by a check in a
+# later round is the case where stale bets used to be counted again
+_SCRIPT = {0: "bet", 3: "check", 4: "raise", 5: "check"}
+
+
+def scripted_decision(player_hand, community_cards, max_retries=2):
+    """
+    Stands in for `ollama_integration.get_ai_decision`, deciding by street only.
+    """
+    return _SCRIPT[len(community_cards)]
+
+
+@unittest.skipUnless(importlib.util.find_spec("requests"), "game.py needs the requests package")
+class PotAccountingTest(unittest.TestCase):
+    def setUp(self):
+        from game import PokerGame
+        self.game = PokerGame(logging_enabled=True)
+        self.game.deck = Deck(seed=7)
+        for seat, player in enumerate(self.game.players):
+            player._rng = random.Random(seat)
+        patcher = mock.patch("player.get_ai_decision", scripted_decision)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.game.close)
+
+    def play_streets(self):
+        """
+        Yields after each betting round of one hand.
+        """
+        game = self.game
+        for play in (game.play_pre_flop, game.play_flop, game.play_turn, game.play_river):
+            with redirect_stdout(StringIO()):
+                play()
+            yield
+
+    def test_pot_holds_the_chips_taken_from_the_stacks(self):
+        game = self.game
+        for _ in range(5):
+            chips_at_start = sum(game.state.chips)
+            for _ in self.play_streets():
+                self.assertEqual(game.pot, chips_at_start - sum(game.state.chips))
+            game.determine_winner()
+            for player in game.players:
+                player.reset_for_next_round()
+                player.chips = max(player.chips, 1000)  # Keep everyone betting
+
+    def test_checks_after_a_bet_commit_no_chips(self):
+        game = self.game
+        streets = self.play_streets()
+        next(streets)  # Pre-flop: everyone bets
+        self.assertTrue(all(player.current_bet > 0 for player in game.players))
+        pot_after_bets = game.pot
+
+        next(streets)  # Flop: everyone checks
+        self.assertEqual(game.pot, pot_after_bets)
+        self.assertEqual([player.current_bet for player in game.players], [0] * game.num_players)
+        self.assertTrue(all(line.endswith("checks 0 chips.") for line in game.get_log()[-game.num_players:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
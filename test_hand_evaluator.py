@@ -0,0 +1,85 @@
+"""
+test_hand_evaluator.py
+
+Regression tests for hand_evaluator.py. The table-driven scoring (`evaluate_cards`, `evaluate7`,
+`evaluate_holdings`) is checked against the rank-by-rank reference evaluation, and the hands whose scoring
+was fixed (two sets of trips, the highest straight window, the best full house pair, short hands) are
+pinned to their expected results.
+
+Run with: python -m unittest
+"""
+
+import importlib.util
+import random
+import unittest
+
+from deck import Deck, encode_card
+from hand_evaluator import (
+    _evaluate_ranks, _pack_score, decode_score, evaluate7, evaluate_cards, evaluate_hand, evaluate_holdings,
+)
+
+
+def cards(*names):
+    """
+    Builds packed cards from short names such as "As", "Td" or "9h" (rank, then suit initial).
+    """
+    ranks = {'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+    suits = {'h': 'hearts', 'd': 'diamonds', 'c': 'clubs', 's': 'spades'}
+    return [encode_card(ranks.get(name[0]) or int(name[0]), suits[name[1]]) for name in names]
+
+
+class FixedHandsTest(unittest.TestCase):
+    def test_two_sets_of_trips_make_a_full_house(self):
+        self.assertEqual(evaluate_hand(cards("Ks", "Kh"), cards("Kd", "Qs", "Qh", "Qd", "2c")), (7, [13, 12]))
+
+    def test_full_house_plays_the_highest_pair(self):
+        self.assertEqual(evaluate_hand(cards("Ks", "Kh"), cards("Kd", "2s", "2h", "Qd", "Qc")), (7, [13, 12]))
+
+    def test_straight_uses_the_highest_window(self):
+        # Six consecutive ranks with a paired card: the 10-high straight plays, not the 9-high one
+        self.assertEqual(evaluate_hand(cards("5s", "6h"), cards("7d", "8c", "9s", "Th", "Td")), (5, [10, 9, 8, 7, 6]))
+
+    def test_wheel_plays_the_ace_low(self):
+        self.assertEqual(evaluate_hand(cards("As", "2h"), cards("3d", "4c", "5s", "9h", "Kd")), (5, [5, 4, 3, 2, 14]))
+
+    def test_straight_flush_ranks_come_from_the_flush_suit(self):
+        hand_rank, best_ranks = evaluate_hand(cards("9h", "Ts"), cards("5h", "6h", "7h", "8h", "Qd"))
+        self.assertEqual((hand_rank, best_ranks), (9, [9, 8, 7, 6, 5]))
+
+    def test_short_hands_score_rank_by_rank(self):
+        self.assertEqual(evaluate_hand(cards("Ah", "Ks"), []), (1, [14, 13]))
+        self.assertEqual(evaluate_hand(cards("Ah", "As"), []), (2, [14]))
+        self.assertEqual(evaluate_hand(cards("Ah", "As"), cards("Ks", "Kc")), (3, [14, 13]))
+        self.assertEqual(decode_score(evaluate_cards(cards("Ah", "Ks"))), (1, [14, 13, 0, 0, 0]))
+
+
+class TableAgreementTest(unittest.TestCase):
+    def test_lookups_match_the_rank_by_rank_evaluation(self):
+        rng = random.Random(2024)
+        deck = Deck(seed=1).cards
+        for _ in range(3000):
+            hand = rng.sample(deck, rng.choice((5, 6, 7)))
+            expected = _pack_score(*_evaluate_ranks(hand))
+            self.assertEqual(evaluate_cards(hand), expected, hand)
+            if len(hand) == 7:
+                self.assertEqual(evaluate7(*hand), expected, hand)
+                self.assertEqual(evaluate_holdings([hand[:2]], hand[2:]), [expected], hand)
+
+
+@unittest.skipUnless(importlib.util.find_spec("requests"), "game.py needs the requests package")
+class HandNamesTest(unittest.TestCase):
+    def test_hand_values_map_to_names(self):
+        from game import PokerGame
+        game = PokerGame(logging_enabled=False)
+        try:
+            self.assertEqual(game.describe_hand_value(1), "High Card")
+            self.assertEqual(game.describe_hand_value(5), "Straight")
+            self.assertEqual(game.describe_hand_value(9), "Straight Flush")
+            with self.assertRaises(ValueError):
+                game.describe_hand_value(0)
+        finally:
+            game.close()
+
+
+if __name__ == "__main__":
+    unittest.main()